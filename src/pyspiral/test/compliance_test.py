@@ -8,24 +8,48 @@ This module loads the same JSON fixtures used by the TypeScript implementation
 and verifies that the Python implementation produces identical results.
 """
 
+import asyncio
+import functools
 import json
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 from pyspiral.evaluator import evaluate_air_cir, evaluate_eir
 from pyspiral.lir.evaluator import evaluate_lir
 from pyspiral.lir.async_evaluator import evaluate_lir_async
-from pyspiral.env import empty_defs
-from pyspiral.effects import empty_effect_registry
-from pyspiral.domains.registry import empty_registry
+from pyspiral.env import Defs, empty_defs
+from pyspiral.effects import EffectRegistry, empty_effect_registry
+from pyspiral.domains.registry import OperatorRegistry, empty_registry
+
+# Use orjson for fixture parsing when available.
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+
+# Digit runs long enough to overflow 64 bits. orjson silently reads such integers
+# as floats, while SPIRAL ints are unbounded. Matches inside strings or long
+# fractions only cost a fallback to the stdlib parser.
+_WIDE_DIGITS = re.compile(rb"\d{19,}")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson unless the data may hold integers wider than 64 bits."""
+    if _has_orjson and not _WIDE_DIGITS.search(data):
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 #==============================================================================
 # Test Fixture Definition
 #==============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpectedOutput:
     """Expected output - normalized form that works across implementations."""
     value: Any
@@ -34,7 +58,7 @@ class ExpectedOutput:
     error: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FixtureMetadata:
     """Fixture metadata."""
     layer: Literal["AIR", "CIR", "EIR", "LIR"]
@@ -42,7 +66,7 @@ class FixtureMetadata:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComplianceFixture:
     """A test fixture for cross-implementation compliance."""
     id: str
@@ -56,119 +80,208 @@ class ComplianceFixture:
 # Value Comparison Utilities
 #==============================================================================
 
+def _json_key(key: Any) -> str:
+    """Convert a dict key to the string json.dumps would write for it."""
+    if type(key) is str:
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Convert a JSON-like value into a hashable form with order-independent dict keys.
+    Dicts become frozensets of items so they can never collide with lists (tuples),
+    and leaves are tagged with their type so True, 1 and 1.0 stay distinct.
+    Keys are stringified, tuples are treated as lists and NaN equals NaN, as with json.dumps.
+    Raises TypeError for leaves that are not hashable.
+    """
+    if isinstance(value, dict):
+        return frozenset((_json_key(k), _canonical(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if type(value) is float and value != value:
+        return (float, "NaN")
+    return (type(value), value)
+
+
 def deep_equal(actual: Any, expected: Any, tolerance: float = 0) -> bool:
     """
     Deep compare two values for structural equality.
     Handles floating-point tolerance and set ordering.
     """
-    # Handle null/None
-    if actual is None:
-        return actual == expected
-    if expected is None:
-        return False
+    if actual is expected:
+        return True
 
-    # Primitive values
-    if not isinstance(actual, dict) or not isinstance(expected, dict):
+    # Primitive values (including None)
+    if type(actual) is not dict or type(expected) is not dict:
         return actual == expected
 
-    actual_obj = actual
-    expected_obj = expected
+    kind = actual.get("kind")
 
     # Compare by kind
-    if "kind" in actual_obj and "kind" in expected_obj:
-        if actual_obj["kind"] != expected_obj["kind"]:
-            return False
-
-    kind = actual_obj.get("kind")
-
-    match kind:
-        case "int" | "bool" | "string":
-            return actual_obj.get("value") == expected_obj.get("value")
-
-        case "float":
-            actual_value = actual_obj.get("value", 0) if isinstance(actual_obj.get("value"), (int, float)) else 0
-            expected_value = expected_obj.get("value", 0) if isinstance(expected_obj.get("value"), (int, float)) else 0
-            if tolerance > 0:
-                return abs(actual_value - expected_value) <= tolerance
-            return actual_value == expected_value
-
-        case "list":
-            actual_list = actual_obj.get("value", [])
-            expected_list = expected_obj.get("value", [])
-            if not isinstance(actual_list, list) or not isinstance(expected_list, list):
-                return False
-            if len(actual_list) != len(expected_list):
-                return False
-            return all(
-                deep_equal(actual_list[i], expected_list[i], tolerance)
-                for i in range(len(actual_list))
-            )
+    if kind is not None and "kind" in expected and kind != expected["kind"]:
+        return False
 
-        case "set":
-            actual_list = actual_obj.get("value", [])
-            expected_list = expected_obj.get("value", [])
-            if not isinstance(actual_list, list) or not isinstance(expected_list, list):
-                return False
-            if len(actual_list) != len(expected_list):
-                return False
-            # Sets are unordered - compare as sets
-            actual_items = {json.dumps(item, sort_keys=True) for item in actual_list}
-            expected_items = {json.dumps(item, sort_keys=True) for item in expected_list}
-            return expected_items.issubset(actual_items)
+    # Non-string kinds (possibly unhashable) go straight to the fallback
+    handler = _KIND_HANDLERS.get(kind) if isinstance(kind, str) else None
+    if handler is None:
+        return _canonical_fallback(actual, expected)
+    return handler(actual, expected, tolerance)
 
-        case "void":
-            return kind == expected_obj.get("kind")
 
-        case "error":
-            return actual_obj.get("code") == expected_obj.get("code")
+def _cmp_value(actual_obj: dict[str, Any], expected_obj: dict[str, Any], tolerance: float) -> bool:
+    return actual_obj.get("value") == expected_obj.get("value")
 
-        case _:
-            # For unknown types, fall back to JSON comparison
-            return json.dumps(actual, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+def _cmp_float(actual_obj: dict[str, Any], expected_obj: dict[str, Any], tolerance: float) -> bool:
+    actual_value = actual_obj.get("value", 0) if isinstance(actual_obj.get("value"), (int, float)) else 0
+    expected_value = expected_obj.get("value", 0) if isinstance(expected_obj.get("value"), (int, float)) else 0
+    if tolerance > 0:
+        return abs(actual_value - expected_value) <= tolerance
+    return actual_value == expected_value
+
+
+def _all_int_values(items: list[Any]) -> bool:
+    return all(type(x) is dict and x.get("kind") == "int" for x in items)
+
+
+def _cmp_list(actual_obj: dict[str, Any], expected_obj: dict[str, Any], tolerance: float) -> bool:
+    actual_list = actual_obj.get("value", [])
+    expected_list = expected_obj.get("value", [])
+    if not isinstance(actual_list, list) or not isinstance(expected_list, list):
+        return False
+    if len(actual_list) != len(expected_list):
+        return False
+    # Lists of ints (the most common fixture shape) compare as plain value lists
+    if _all_int_values(actual_list) and _all_int_values(expected_list):
+        return [x.get("value") for x in actual_list] == [x.get("value") for x in expected_list]
+    return all(deep_equal(a, e, tolerance) for a, e in zip(actual_list, expected_list))
+
+
+def _cmp_set(actual_obj: dict[str, Any], expected_obj: dict[str, Any], tolerance: float) -> bool:
+    actual_list = actual_obj.get("value", [])
+    expected_list = expected_obj.get("value", [])
+    if not isinstance(actual_list, list) or not isinstance(expected_list, list):
+        return False
+    if len(actual_list) != len(expected_list):
+        return False
+    # Sets are unordered - compare as sets
+    try:
+        actual_items = {_canonical(item) for item in actual_list}
+        expected_items = {_canonical(item) for item in expected_list}
+    except TypeError:
+        # Unhashable leaves - compare serialized elements instead
+        actual_items = {json.dumps(item, sort_keys=True) for item in actual_list}
+        expected_items = {json.dumps(item, sort_keys=True) for item in expected_list}
+    return expected_items <= actual_items
+
+
+def _cmp_void(actual_obj: dict[str, Any], expected_obj: dict[str, Any], tolerance: float) -> bool:
+    # Kinds were already compared when both sides carry one
+    return "kind" in expected_obj
+
+
+def _cmp_error(actual_obj: dict[str, Any], expected_obj: dict[str, Any], tolerance: float) -> bool:
+    return actual_obj.get("code") == expected_obj.get("code")
+
+
+def _canonical_fallback(actual: Any, expected: Any) -> bool:
+    # For unknown kinds, compare canonical forms; unlike JSON, True, 1 and 1.0 differ
+    try:
+        return _canonical(actual) == _canonical(expected)
+    except TypeError:
+        # Unhashable leaves - compare serialized values instead
+        return json.dumps(actual, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+
+# Comparison handler for each value kind
+_KIND_HANDLERS: dict[str, Callable[[dict[str, Any], dict[str, Any], float], bool]] = {
+    "int": _cmp_value,
+    "bool": _cmp_value,
+    "string": _cmp_value,
+    "float": _cmp_float,
+    "list": _cmp_list,
+    "set": _cmp_set,
+    "void": _cmp_void,
+    "error": _cmp_error,
+}
+
+
+_IMPLEMENTATION_SPECIFIC_KINDS = frozenset({"closure", "future"})
+
+
+def _needs_normalization(value: Any) -> bool:
+    """Check whether a value contains any closure or future along its nested values."""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if not isinstance(current, dict):
+            continue
+        if current.get("kind") in _IMPLEMENTATION_SPECIFIC_KINDS:
+            return True
+        inner = current.get("value")
+        if isinstance(inner, list):
+            stack.extend(inner)
+        elif isinstance(inner, dict):
+            stack.extend(inner.values())
+    return False
 
 
 def normalize_value(value: Any) -> Any:
     """
     Normalize a value for cross-implementation comparison.
     Removes implementation-specific artifacts (e.g., closure IDs, task IDs).
+    Only closures and futures are rewritten; containers keep all their other keys,
+    and values without closures or futures are returned as-is.
     """
-    if not isinstance(value, dict) or value is None:
+    if not _needs_normalization(value):
         return value
 
-    # Remove closure function IDs (implementation-specific)
-    if value.get("kind") == "closure":
-        return {
-            "kind": "closure",
-            "params": value.get("params"),
-            "body": value.get("body"),
-            "env": "<env>",  # Don't compare env contents
-        }
-
-    # Remove task IDs from futures (implementation-specific)
-    if value.get("kind") == "future":
-        return {
-            "kind": "future",
-            "of": normalize_value(value.get("of")),
-            "status": value.get("status"),
-        }
-
-    # Recursively normalize nested values
-    if "value" in value and isinstance(value["value"], object):
-        if isinstance(value["value"], list):
-            return {
-                "kind": value.get("kind"),
-                "value": [normalize_value(v) for v in value["value"]],
-            }
-        if value["value"] is not None:
-            normalized = {}
-            for key, val in value["value"].items():
-                normalized[key] = normalize_value(val)
-            return {
-                "kind": value.get("kind"),
-                "value": normalized,
+    # Build the output tree iteratively: each work item fills container[key]
+    root: list[Any] = [None]
+    work: list[tuple[Any, Any, Any]] = [(root, 0, value)]
+    while work:
+        container, key, current = work.pop()
+
+        if not isinstance(current, dict):
+            container[key] = current
+            continue
+
+        kind = current.get("kind")
+
+        # Remove closure function IDs (implementation-specific)
+        if kind == "closure":
+            container[key] = {
+                "kind": "closure",
+                "params": current.get("params"),
+                "body": current.get("body"),
+                "env": "<env>",  # Don't compare env contents
             }
-
-    return value
+            continue
+
+        # Remove task IDs from futures (implementation-specific)
+        if kind == "future":
+            normalized_future = {"kind": "future", "of": None, "status": current.get("status")}
+            container[key] = normalized_future
+            work.append((normalized_future, "of", current.get("of")))
+            continue
+
+        # Recursively normalize nested values, preserving the container's other keys
+        inner = current.get("value")
+        if isinstance(inner, list):
+            normalized_list: list[Any] = [None] * len(inner)
+            container[key] = {**current, "value": normalized_list}
+            work.extend((normalized_list, i, v) for i, v in enumerate(inner))
+        elif isinstance(inner, dict):
+            normalized_map: dict[str, Any] = dict.fromkeys(inner)
+            container[key] = {**current, "value": normalized_map}
+            work.extend((normalized_map, k, v) for k, v in inner.items())
+        else:
+            container[key] = current
+
+    return root[0]
 
 
 #==============================================================================
@@ -427,52 +540,134 @@ COMPLIANCE_FIXTURES: list[ComplianceFixture] = [
     ),
 ]
 
+# Lookup indexes over the registry, built once at import
+_FIXTURE_BY_ID: dict[str, ComplianceFixture] = {}
+_FIXTURES_BY_LAYER: dict[str, tuple[ComplianceFixture, ...]] = {}
+
+
+def _build_fixture_indexes() -> None:
+    by_layer: dict[str, list[ComplianceFixture]] = {}
+    for fixture in COMPLIANCE_FIXTURES:
+        _FIXTURE_BY_ID.setdefault(fixture.id, fixture)
+        if fixture.metadata:
+            by_layer.setdefault(fixture.metadata.layer, []).append(fixture)
+    for layer, fixtures in by_layer.items():
+        _FIXTURES_BY_LAYER[layer] = tuple(fixtures)
+
+
+_build_fixture_indexes()
+
 
 #==============================================================================
 # Fixture Loading Utilities
 #==============================================================================
 
+def _contains_fork(node: Any) -> bool:
+    """Check whether a document contains a fork terminator anywhere."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if current.get("kind") == "fork":
+                return True
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json_cached(path_str: str) -> dict[str, Any]:
+    """
+    Read and parse a JSON file once per session.
+    The evaluators never mutate documents, so the parsed dict is shared.
+    """
+    with open(path_str, "rb") as f:
+        return _loads(f.read())
+
+
+# Repository root, which fixture paths are relative to
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _resolve_path(path_str: str) -> Path:
+    """Resolve a fixture-relative path against the working directory, then the repository root."""
+    path = Path(path_str)
+    if not path.is_file():
+        path = _REPO_ROOT / path_str
+    return path.resolve()
+
+
+# Absolute document path for each registered fixture, resolved once at import
+_RESOLVED_DOC_PATH: dict[str, str] = {
+    f.id: str(_resolve_path(f.document_path)) for f in COMPLIANCE_FIXTURES
+}
+
+
+def _resolve_document_path(fixture: ComplianceFixture) -> str:
+    """Resolve a fixture's document path to an absolute path string."""
+    resolved = _RESOLVED_DOC_PATH.get(fixture.id)
+    # Fixtures built outside the registry are resolved on demand
+    if resolved is None or get_fixture_by_id(fixture.id) is not fixture:
+        resolved = str(_resolve_path(fixture.document_path))
+    return resolved
+
+
 def load_fixture_document(fixture: ComplianceFixture) -> dict[str, Any]:
     """Load a fixture's SPIRAL document."""
-    path = Path(fixture.document_path)
-    if not path.exists():
-        # Try relative to examples directory
-        path = Path(__file__).parent.parent.parent / fixture.document_path
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_cached(_resolve_document_path(fixture))
+
+
+@functools.lru_cache(maxsize=None)
+def doc_contains_fork(path_str: str) -> bool:
+    """
+    Check whether the JSON document at a path contains a fork terminator.
+    Walks the session-cached parsed document, so no file is read twice.
+    """
+    return _contains_fork(_load_json_cached(path_str))
 
 
 def load_fixture_inputs(fixture: ComplianceFixture) -> dict[str, Any] | None:
     """Load a fixture's inputs (if provided)."""
     if not fixture.inputs_path:
         return None
-    path = Path(fixture.inputs_path)
-    if not path.exists():
-        # Try relative to examples directory
-        path = Path(__file__).parent.parent.parent / fixture.inputs_path
-    if not path.exists():
+    path = _resolve_path(fixture.inputs_path)
+    if not path.is_file():
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_cached(str(path))
 
 
-def get_fixtures_by_layer(layer: str) -> list[ComplianceFixture]:
+def get_fixtures_by_layer(layer: str) -> tuple[ComplianceFixture, ...]:
     """Get fixtures by layer."""
-    return [f for f in COMPLIANCE_FIXTURES if f.metadata and f.metadata.layer == layer]
+    return _FIXTURES_BY_LAYER.get(layer, ())
 
 
 def get_fixture_by_id(fixture_id: str) -> ComplianceFixture | None:
     """Get fixture by ID."""
-    for fixture in COMPLIANCE_FIXTURES:
-        if fixture.id == fixture_id:
-            return fixture
-    return None
+    return _FIXTURE_BY_ID.get(fixture_id)
 
 
 #==============================================================================
 # Fixture Execution
 #==============================================================================
 
+# The evaluators only read from these registries, so one instance of each is
+# shared by every fixture (including concurrently running ones).
+@functools.lru_cache(maxsize=1)
+def _shared_registry() -> OperatorRegistry:
+    return empty_registry()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_defs() -> Defs:
+    return empty_defs()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_effect_registry() -> EffectRegistry:
+    return empty_effect_registry()
+
+
 async def execute_fixture(fixture: ComplianceFixture) -> dict[str, Any]:
     """
     Execute a fixture using the Python implementation.
@@ -481,33 +676,33 @@ async def execute_fixture(fixture: ComplianceFixture) -> dict[str, Any]:
     inputs = load_fixture_inputs(fixture)
 
     layer = fixture.metadata.layer if fixture.metadata else "AIR"
-    registry = empty_registry()
-    defs = empty_defs()
-    effects = empty_effect_registry()
+    registry = _shared_registry()
+    defs = _shared_defs()
+    effects = _shared_effect_registry()
 
     # Parse inputs if provided
     input_map: dict[str, Any] = {}
     if inputs:
         input_map = inputs
 
+    # Sync evaluators run in worker threads so concurrent fixtures can overlap
     match layer:
         case "AIR" | "CIR":
             # AIR/CIR uses evaluate_air_cir
-            result = evaluate_air_cir(doc, registry, defs, input_map)
+            result = await asyncio.to_thread(evaluate_air_cir, doc, registry, defs, input_map)
             return result
 
         case "EIR":
             # EIR uses evaluate_eir
-            result = evaluate_eir(doc, registry, defs, input_map, effects)
+            result = await asyncio.to_thread(evaluate_eir, doc, registry, defs, input_map, effects)
             return result
 
         case "LIR":
             # Check if this is an async LIR document (has fork terminator)
-            is_async = '"kind": "fork"' in json.dumps(doc)
-            if is_async:
+            if doc_contains_fork(_resolve_document_path(fixture)):
                 result = await evaluate_lir_async(doc, registry, effects, input_map, defs)
                 return result
-            result = evaluate_lir(doc, registry, effects, input_map, defs)
+            result = await asyncio.to_thread(evaluate_lir, doc, registry, effects, input_map, defs)
             return result
 
         case _:
@@ -543,9 +738,9 @@ def verify_fixture_result(fixture: ComplianceFixture, result: dict[str, Any]) ->
                 f"  Actual:   {json.dumps(normalized_result, indent=2)}"
             )
     else:
-        # String comparison
-        actual_string = json.dumps(normalized_result)
-        expected_string = json.dumps(expected.value)
+        # String comparison (compact encoding - whitespace never affects the outcome)
+        actual_string = json.dumps(normalized_result, separators=(",", ":"))
+        expected_string = json.dumps(expected.value, separators=(",", ":"))
         if actual_string != expected_string:
             raise AssertionError(
                 f"String representation mismatch:\n"
@@ -558,6 +753,10 @@ def verify_fixture_result(fixture: ComplianceFixture, result: dict[str, Any]) ->
 # Test Runner
 #==============================================================================
 
+# Upper bound on fixtures executing at once in run_all_fixtures
+MAX_CONCURRENT_FIXTURES = 8
+
+
 async def run_all_fixtures() -> dict[str, list[str]]:
     """
     Run all compliance fixtures and return results.
@@ -572,21 +771,33 @@ async def run_all_fixtures() -> dict[str, list[str]]:
         "LIR": [],
     }
 
-    for fixture in COMPLIANCE_FIXTURES:
-        try:
-            result = await execute_fixture(fixture)
-            verify_fixture_result(fixture, result)
-            print(f"✓ [{fixture.metadata.layer if fixture.metadata else '?'}] {fixture.id}")
-        except AssertionError as e:
-            layer = fixture.metadata.layer if fixture.metadata else "?"
-            if layer in results:
-                results[layer].append(fixture.id)
-            print(f"✗ [{layer}] {fixture.id}: {e}")
-        except Exception as e:
-            layer = fixture.metadata.layer if fixture.metadata else "?"
-            if layer in results:
-                results[layer].append(fixture.id)
-            print(f"✗ [{layer}] {fixture.id}: {e}")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FIXTURES)
+
+    async def run_one(fixture: ComplianceFixture) -> str | None:
+        async with semaphore:
+            try:
+                result = await execute_fixture(fixture)
+                verify_fixture_result(fixture, result)
+            except Exception as e:
+                return str(e)
+        return None
+
+    # Snapshot the registry so reporting covers exactly the fixtures run
+    fixtures = list(COMPLIANCE_FIXTURES)
+    errors = await asyncio.gather(*(run_one(fixture) for fixture in fixtures))
+
+    log_lines: list[str] = []
+    for fixture, error in zip(fixtures, errors):
+        layer = fixture.metadata.layer if fixture.metadata else "?"
+        if error is None:
+            log_lines.append(f"✓ [{layer}] {fixture.id}")
+            continue
+        if layer in results:
+            results[layer].append(fixture.id)
+        log_lines.append(f"✗ [{layer}] {fixture.id}: {error}")
+
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
 
     return results
 
@@ -614,8 +825,6 @@ def print_summary(results: dict[str, list[str]]) -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     results = asyncio.run(run_all_fixtures())
     print_summary(results)
 